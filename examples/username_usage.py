@@ -12,8 +12,8 @@ async def main():
     # List all groups to see available usernames
     groups = await tg.list_groups()
     print("Available groups:")
-    for _, group in groups.head(5).iterrows():
-        print(f"  {group['Title']}: {group['Identifier']}")
+    for group in groups.head(5).itertuples(index=False):
+        print(f"  {group.Title}: {group.Identifier}")
     
     print("\n" + "="*50 + "\n")
     
@@ -14,6 +14,9 @@ setup(
         'Telethon',
         'pandas',  # Optional but recommended for better performance
     ],
+    extras_require={
+        'parquet': ['pyarrow'],  # For get_messages(stream_to=...)
+    },
 
     classifiers=[
         'Development Status :: 3 - Alpha',  # Development status
@@ -4,54 +4,49 @@ tgdata - Telegram Data Extraction Library
 A production-grade Python library for extracting and processing Telegram group and channel messages.
 """
 
-# Main class
-from .tgdata import TgData
-
-# Models
-from .models import (
-    MessageData,
-    GroupInfo,
-    ConnectionConfig,
-    RateLimitInfo
-)
-
-# Utilities
-from .utils import (
-    format_message_for_display,
-    export_to_json,
-    export_to_csv,
-    filter_messages_by_sender,
-    filter_messages_by_content,
-    get_message_statistics,
-    save_profile_photos,
-    create_metrics_report
-)
-
-# Progress tracking
-from .progress import ProgressTracker
+import importlib
 
 __version__ = "0.0.0"
 
-__all__ = [
+# Public names and the submodule they live in. Submodules are imported on
+# first attribute access (PEP 562), so `import tgdata` does not pull in
+# pandas or Telethon until something that needs them is used.
+_LAZY_IMPORTS = {
     # Main class
-    "TgData",
-    
+    "TgData": ".tgdata",
+
     # Models
-    "MessageData",
-    "GroupInfo",
-    "ConnectionConfig",
-    "RateLimitInfo",
-    
+    "MessageData": ".models",
+    "GroupInfo": ".models",
+    "ConnectionConfig": ".models",
+    "RateLimitInfo": ".models",
+
     # Utilities
-    "format_message_for_display",
-    "export_to_json",
-    "export_to_csv",
-    "filter_messages_by_sender",
-    "filter_messages_by_content",
-    "get_message_statistics",
-    "save_profile_photos",
-    "create_metrics_report",
-    
-    # Progress
-    "ProgressTracker"
-]
\ No newline at end of file
+    "format_message_for_display": ".utils",
+    "export_to_json": ".utils",
+    "export_to_csv": ".utils",
+    "filter_messages_by_sender": ".utils",
+    "filter_messages_by_content": ".utils",
+    "get_message_statistics": ".utils",
+    "save_profile_photos": ".utils",
+    "create_metrics_report": ".utils",
+
+    # Progress tracking
+    "ProgressTracker": ".progress",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
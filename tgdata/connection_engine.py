@@ -98,6 +98,8 @@ class ConnectionEngine:
         self._pool: Optional[ConnectionPool] = None
         self._health_check_interval = 300  # 5 minutes
         self._last_health_check = 0
+        # Created on first use so it binds to the running event loop
+        self._connect_lock: Optional[asyncio.Lock] = None
         
     def _load_config(self) -> ConnectionConfig:
         """Load configuration from file"""
@@ -135,9 +137,9 @@ class ConnectionEngine:
         Get a connected Telegram client.
         Uses pooling if enabled, otherwise returns primary client.
         """
-        # Check if health check needed
+        # Check if health check needed (nothing to check before the first connect)
         current_time = time.time()
-        if current_time - self._last_health_check > self._health_check_interval:
+        if self._primary_client and current_time - self._last_health_check > self._health_check_interval:
             await self.health_check()
             self._last_health_check = current_time
             
@@ -145,12 +147,19 @@ class ConnectionEngine:
         if self.pool_size > 1 and self._pool:
             return await self._pool.get_connection()
             
-        # Otherwise ensure primary client is connected
-        if not self._primary_client:
-            await self._init_primary_client()
-            
-        if not self._primary_client.is_connected():
-            await self._connect_with_retry(self._primary_client)
+        # Otherwise ensure primary client is connected. Concurrent callers
+        # (e.g. gathered fetches) wait for a single connect instead of each
+        # creating and starting their own client on the same session file
+        if not self._primary_client or not self._primary_client.is_connected():
+            if self._connect_lock is None:
+                self._connect_lock = asyncio.Lock()
+                
+            async with self._connect_lock:
+                if not self._primary_client:
+                    await self._init_primary_client()
+                    
+                if not self._primary_client.is_connected():
+                    await self._connect_with_retry(self._primary_client)
             
         return self._primary_client
         
@@ -168,6 +177,9 @@ class ConnectionEngine:
         
         await self._connect_with_retry(self._primary_client)
         
+        # A fresh connection is healthy, start the health check interval from here
+        self._last_health_check = time.time()
+        
         # Initialize pool if needed
         if self.pool_size > 1:
             await self._init_pool()
@@ -5,10 +5,14 @@ Handles message fetching, filtering, deduplication, and formatting.
 
 import asyncio
 import logging
+import os
+from collections import OrderedDict
 from datetime import datetime
-from typing import Optional, List, Dict, Any, Callable
+from typing import Optional, List, Dict, Any, Callable, Union
+import numpy as np
 import pandas as pd
-from telethon.errors import FloodWaitError
+from telethon.errors import FloodWaitError, ChannelInvalidError, ChannelPrivateError
+from telethon.utils import parse_username
 
 from .connection_engine import ConnectionEngine
 from .models import MessageData
@@ -16,6 +20,153 @@ from .progress import ProgressTracker
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on the number of resolved senders kept between fetches
+SENDER_CACHE_SIZE = 10000
+
+# Upper bound on the number of resolved groups kept between fetches
+ENTITY_CACHE_SIZE = 128
+
+# Maximum number of profile photos downloaded at the same time
+PHOTO_DOWNLOAD_CONCURRENCY = 8
+
+# Rows buffered per Parquet row group when streaming with stream_to
+STREAM_ROW_GROUP_SIZE = 10000
+
+
+def _import_pyarrow():
+    """Import pyarrow, which is only needed for streaming to Parquet"""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError(
+            "stream_to requires pyarrow. Install it with: pip install tgdata[parquet]"
+        ) from e
+    return pa, pq
+
+
+def _parquet_schema(pa):
+    """Arrow schema matching the columns of MessageData.to_dict()"""
+    return pa.schema([
+        ('MessageId', pa.int64()),
+        ('SenderId', pa.int64()),
+        ('Name', pa.string()),
+        ('Username', pa.string()),
+        ('Message', pa.string()),
+        ('Date', pa.timestamp('us', tz='UTC')),
+        ('ReplyToId', pa.int64()),
+        ('ForwardedFrom', pa.string()),
+        ('PhotoData', pa.binary())
+    ])
+
+
+def _entity_cache_key(group_id):
+    """
+    Normalize a group ID or username for the entity cache.
+    
+    '@Chan', 'chan' and 'https://t.me/Chan' share one key. Invite links are
+    case-sensitive and are kept as given, like any other string.
+    """
+    if isinstance(group_id, str):
+        username, is_invite = parse_username(group_id)
+        if username and not is_invite:
+            return username.lower()
+    return group_id
+
+
+def _sender_name(sender) -> str:
+    """Return "first last" for a sender, or just the part that is set"""
+    first = getattr(sender, 'first_name', None) or ''
+    last = getattr(sender, 'last_name', None)
+    if last:
+        return (first + ' ' + last).strip()
+    return first.strip()
+
+
+def _sender_username(sender) -> str:
+    """Return "@username" for a sender, or "No username" if it has none"""
+    username = getattr(sender, 'username', None)
+    return '@' + username if username else 'No username'
+
+
+class _MessageColumns:
+    """
+    Column-oriented buffer of processed messages.
+    Keeps one list per DataFrame column so the frame is built in one step,
+    without creating a dict per message and inferring columns from it.
+    Name and Username values are interned, so every row of the same sender
+    points at one string object instead of a fresh copy per message.
+    """
+    
+    def __init__(self):
+        self._interned: Dict[str, str] = {}
+        self.clear()
+        
+    def clear(self) -> None:
+        """Drop all buffered messages."""
+        self.message_ids: List[int] = []
+        self.sender_ids: List[int] = []
+        self.names: List[str] = []
+        self.usernames: List[str] = []
+        self.messages: List[Optional[str]] = []
+        self.dates: List[datetime] = []
+        self.reply_to_ids: List[Optional[int]] = []
+        self.forwarded_from: List[Any] = []
+        self.photo_data: List[Optional[bytes]] = []
+        
+    def __len__(self) -> int:
+        return len(self.message_ids)
+        
+    def append(self, message_data: MessageData) -> None:
+        """Add one message to the buffer."""
+        self.message_ids.append(message_data.message_id)
+        self.sender_ids.append(message_data.sender_id)
+        intern = self._interned.setdefault
+        self.names.append(intern(message_data.sender_name, message_data.sender_name))
+        self.usernames.append(intern(message_data.username, message_data.username))
+        self.messages.append(message_data.message)
+        self.dates.append(message_data.date)
+        self.reply_to_ids.append(message_data.reply_to_id)
+        self.forwarded_from.append(message_data.forwarded_from)
+        self.photo_data.append(message_data.photo_data)
+        
+    def to_dataframe(self) -> pd.DataFrame:
+        """Build a DataFrame with the same columns as MessageData.to_dict()."""
+        if not self.message_ids:
+            return pd.DataFrame()
+            
+        return pd.DataFrame({
+            'MessageId': np.array(self.message_ids, dtype=np.int64),
+            'SenderId': np.array(self.sender_ids, dtype=np.int64),
+            'Name': self.names,
+            'Username': self.usernames,
+            'Message': self.messages,
+            'Date': self.dates,
+            'ReplyToId': self.reply_to_ids,
+            'ForwardedFrom': self.forwarded_from,
+            'PhotoData': self.photo_data
+        })
+        
+    def to_arrow(self, pa, schema):
+        """
+        Build a pyarrow Table for Parquet output.
+        
+        ForwardedFrom holds Telethon peer objects, which Arrow cannot store,
+        so it is written as their string form.
+        """
+        forwarded_from = [None if peer is None else str(peer) for peer in self.forwarded_from]
+        return pa.table({
+            'MessageId': pa.array(self.message_ids, type=pa.int64()),
+            'SenderId': pa.array(self.sender_ids, type=pa.int64()),
+            'Name': pa.array(self.names, type=pa.string()),
+            'Username': pa.array(self.usernames, type=pa.string()),
+            'Message': pa.array(self.messages, type=pa.string()),
+            'Date': pa.array(self.dates, type=schema.field('Date').type),
+            'ReplyToId': pa.array(self.reply_to_ids, type=pa.int64()),
+            'ForwardedFrom': pa.array(forwarded_from, type=pa.string()),
+            'PhotoData': pa.array(self.photo_data, type=pa.binary())
+        }, schema=schema)
+
 
 class MessageEngine:
     """
@@ -31,6 +182,100 @@ class MessageEngine:
             connection_engine: Connection engine instance
         """
         self.connection_engine = connection_engine
+        # sender_id -> sender entity, least recently used first
+        self._sender_cache: "OrderedDict[int, Any]" = OrderedDict()
+        # normalized group_id -> resolved InputPeer, least recently used first
+        self._entity_cache: "OrderedDict[Any, Any]" = OrderedDict()
+        
+    async def _get_input_entity(self, client, group_id):
+        """
+        Resolve a group ID or username to an InputPeer, once per group.
+        
+        iter_messages only needs the peer, so get_input_entity is used
+        instead of get_entity and the result is cached on the engine.
+        Usernames are cached case-insensitively and with or without the
+        leading '@' or t.me link, so '@Channel' and 'channel' share one lookup.
+        """
+        key = _entity_cache_key(group_id)
+        peer = self._entity_cache.get(key)
+        if peer is not None:
+            self._entity_cache.move_to_end(key)
+            return peer
+            
+        peer = await client.get_input_entity(group_id)
+        self._entity_cache[key] = peer
+        if len(self._entity_cache) > ENTITY_CACHE_SIZE:
+            self._entity_cache.popitem(last=False)
+        return peer
+        
+    def _lookup_sender(self, msg):
+        """
+        Return the sender of a message if it is known without a network round-trip.
+        
+        Telethon attaches senders from the same GetHistory response to
+        msg.sender; senders seen earlier are kept in an LRU cache keyed by
+        sender_id. Returns None when neither has it.
+        """
+        sender = msg.sender
+        sender_id = msg.sender_id
+        
+        if sender is None:
+            if sender_id is not None:
+                sender = self._sender_cache.get(sender_id)
+                if sender is not None:
+                    self._sender_cache.move_to_end(sender_id)
+        elif sender_id is not None and sender_id not in self._sender_cache:
+            self._remember_sender(sender_id, sender)
+            
+        return sender
+        
+    def _remember_sender(self, sender_id: int, sender) -> None:
+        """Add a sender to the LRU cache, evicting the oldest entry when full"""
+        self._sender_cache[sender_id] = sender
+        if len(self._sender_cache) > SENDER_CACHE_SIZE:
+            self._sender_cache.popitem(last=False)
+            
+    async def _get_sender(self, msg):
+        """Resolve the sender of a message, awaiting get_sender() only on a cache miss"""
+        sender = self._lookup_sender(msg)
+        if sender is None:
+            sender = await msg.get_sender()
+            if sender is not None and msg.sender_id is not None:
+                self._remember_sender(msg.sender_id, sender)
+        return sender
+        
+    async def _download_photo(self,
+                              client,
+                              sender,
+                              semaphore: asyncio.Semaphore) -> Optional[bytes]:
+        """Download one profile photo, limited by the shared semaphore"""
+        async with semaphore:
+            try:
+                return await client.download_profile_photo(sender, file=bytes)
+            except Exception as e:
+                logger.warning("Failed to download photo for %s: %s", sender.id, e)
+                return None
+                
+    async def _attach_photos(self,
+                             columns: _MessageColumns,
+                             photo_tasks: Optional[Dict[int, asyncio.Future]]) -> None:
+        """Wait for the photo downloads of these rows' senders and fill in the PhotoData column"""
+        if not photo_tasks:
+            return
+            
+        # Only this batch's senders: a slow download for a sender that is
+        # not in it must not hold these rows back
+        pending = [
+            photo_tasks[sender_id]
+            for sender_id in set(columns.sender_ids)
+            if sender_id in photo_tasks and not photo_tasks[sender_id].done()
+        ]
+        if pending:
+            await asyncio.gather(*pending)
+        columns.photo_data = [
+            photo_tasks[sender_id].result() if sender_id in photo_tasks else None
+            for sender_id in columns.sender_ids
+        ]
         
     async def fetch_messages(self,
                            group_id: int,
@@ -43,7 +288,10 @@ class MessageEngine:
                            batch_size: Optional[int] = None,
                            batch_callback: Optional[Callable] = None,
                            batch_delay: float = 0.0,
-                           rate_limit_strategy: str = 'wait') -> pd.DataFrame:
+                           rate_limit_strategy: str = 'wait',
+                           stream_to: Optional[Union[str, os.PathLike]] = None,
+                           aggressive: bool = False,
+                           progress_every: int = 1) -> pd.DataFrame:
         """
         Fetch messages from a group with various filters.
         
@@ -59,164 +307,244 @@ class MessageEngine:
             batch_callback: Optional async callback called for each batch (batch_df, batch_info)
             batch_delay: Delay in seconds between batches to avoid rate limits (default: 0)
             rate_limit_strategy: How to handle rate limits - 'wait' or 'exponential' (default: 'wait')
+            stream_to: Optional Parquet file path. Messages are written to it in row
+                groups of STREAM_ROW_GROUP_SIZE instead of being kept in memory (requires pyarrow)
+            aggressive: Don't sleep between history requests. Telethon otherwise waits 1s
+                per request on fetches over 3000 messages; only use for trusted bulk jobs
+            progress_every: Call progress_callback once per this many messages; the final
+                count is always reported (default: 1)
             
         Returns:
-            DataFrame with messages
+            DataFrame with messages, or an empty DataFrame when stream_to is given
         """
+        # Set up Parquet streaming
+        writer = None
+        if stream_to:
+            pa, pq = _import_pyarrow()
+            schema = _parquet_schema(pa)
+            writer = pq.ParquetWriter(str(stream_to), schema)
+            
         # Set up progress tracking
         progress_tracker = None
         if progress_callback:
             progress_tracker = ProgressTracker(
                 total_expected=limit,
-                callback=progress_callback
+                callback=progress_callback,
+                report_every=progress_every
             )
             progress_tracker.start()
             
-        messages_data = []
+        messages_data = _MessageColumns()
         processed_count = 0
         batch_count = 0
         
         # Set up batching if requested
-        batch_messages = []
+        batch_messages = _MessageColumns()
         effective_batch_size = batch_size if batch_size and batch_callback else None
         
+        # Profile photos are downloaded concurrently, once per sender, and
+        # collected just before each DataFrame is built
+        photo_tasks: Optional[Dict[int, asyncio.Future]] = {} if include_profile_photos else None
+        photo_semaphore = asyncio.Semaphore(PHOTO_DOWNLOAD_CONCURRENCY) if include_profile_photos else None
+        
         try:
-            client = await self.connection_engine.get_client()
+            # Get the client and the entity. Rate limits here (username
+            # lookups are often flood-limited) are waited out and retried
+            client = None
+            while True:
+                try:
+                    client = await self.connection_engine.get_client()
+                    channel = await self._get_input_entity(client, group_id)
+                    break
+                except FloodWaitError as e:
+                    await self.connection_engine.handle_rate_limit(e, client, strategy=rate_limit_strategy)
+            logger.info("Fetching messages from: %s", group_id)
             
-            async with client:
-                # Get the entity
-                channel = await client.get_entity(group_id)
-                logger.info(f"Fetching messages from: {channel.title}")
-                
-                # Determine iteration parameters
+            # Determine iteration parameters. With a start date, iterate
+            # oldest-first from start_date so Telegram skips everything
+            # before it instead of us walking back through the history
+            reverse = bool(start_date)  # Reverse if we have a start date
+            if reverse:
+                offset_date = start_date
+            else:
                 offset_date = end_date if end_date else datetime.now()
-                reverse = bool(start_date)  # Reverse if we have a start date
-                
-                # Build kwargs for iter_messages
-                iter_kwargs = {
-                    'entity': channel,
-                    'limit': limit if limit else 100,  # Default limit for polling
-                    'offset_date': offset_date,
-                    'reverse': reverse
-                }
-                
-                # Only add min_id if it's not None
-                if min_id is not None:
-                    # Since min_id includes the ID itself (>= behavior), we already adjusted it in tgdata.py
-                    iter_kwargs['min_id'] = min_id
-                    # When using min_id (for polling), we want chronological order
-                    iter_kwargs['reverse'] = True
-                    # Remove offset_date when using min_id to avoid conflicts
-                    iter_kwargs.pop('offset_date', None)
-                    logger.info(f"Polling with min_id={min_id}, limit={iter_kwargs.get('limit', 'no limit')}")
-                
-                # Track the original min_id to filter duplicates
-                original_min_id = min_id - 1 if min_id else None
+            
+            # Build kwargs for iter_messages
+            iter_kwargs = {
+                'entity': channel,
+                'limit': limit if limit else 100,  # Default limit for polling
+                'offset_date': offset_date,
+                'reverse': reverse
+            }
+            if aggressive:
+                iter_kwargs['wait_time'] = 0
+            
+            # Only add min_id if it's not None
+            if min_id is not None:
+                # Since min_id includes the ID itself (>= behavior), we already adjusted it in tgdata.py
+                iter_kwargs['min_id'] = min_id
+                # When using min_id (for polling), we want chronological order
+                iter_kwargs['reverse'] = True
+                # Remove offset_date when using min_id: Telethon derives offset_id
+                # from min_id in reverse mode and offset_id takes priority, so
+                # start_date has to be checked per message instead
+                iter_kwargs.pop('offset_date', None)
+                logger.info("Polling with min_id=%s, limit=%s", min_id, iter_kwargs.get('limit', 'no limit'))
+            
+            # Track the original min_id to filter duplicates
+            original_min_id = min_id - 1 if min_id else None
+            check_start_date = start_date is not None and min_id is not None
+            
+            # Iterate through messages. A FloodWaitError resumes the
+            # iteration after the last message seen instead of starting over
+            total_limit = iter_kwargs['limit']
+            debug_enabled = logger.isEnabledFor(logging.DEBUG)
+            last_seen_id = None
+            iterated_count = 0
+            while True:
+                try:
+                    async for msg in client.iter_messages(**iter_kwargs):
+                        last_seen_id = msg.id
+                        iterated_count += 1
+                        
+                        # Skip messages we've already seen (when polling)
+                        if original_min_id is not None and msg.id <= original_min_id:
+                            if debug_enabled:
+                                logger.debug("Skipping already-seen message %s <= %s", msg.id, original_min_id)
+                            continue
                 
-                # Iterate through messages
-                async for msg in client.iter_messages(**iter_kwargs):
-                    # Skip messages we've already seen (when polling)
-                    if original_min_id is not None and msg.id <= original_min_id:
-                        logger.info(f"Skipping already-seen message {msg.id} <= {original_min_id}")
-                        continue
+                        # Log messages we're processing
+                        if debug_enabled and min_id is not None:
+                            logger.debug("Processing message %s (min_id was %s, original_min_id was %s)",
+                                         msg.id, min_id, original_min_id)
+                    
+                        # Apply date filters. Without min_id, offset_date already
+                        # makes Telegram skip everything before start_date
+                        if check_start_date and msg.date < start_date:
+                            continue
+                        if end_date and msg.date > end_date:
+                            break
                     
-                    # Log messages we're processing
-                    if min_id is not None:
-                        logger.info(f"Processing message {msg.id} (min_id was {min_id}, original_min_id was {original_min_id})")
-                        
-                    # Apply date filters
-                    if start_date and msg.date < start_date:
-                        continue
-                    if end_date and msg.date > end_date:
-                        break
                         
-                            
-                    # Process message
-                    message_data = await self._process_message(
-                        msg, 
-                        client,
-                        include_profile_photos
-                    )
+                        # Process message. Only senders that are neither attached
+                        # nor cached need an await; everything else stays synchronous
+                        sender = self._lookup_sender(msg)
+                        if sender is None:
+                            message_data = await self._process_message(
+                                msg,
+                                client,
+                                photo_tasks,
+                                photo_semaphore
+                            )
+                        else:
+                            message_data = self._process_message_sync(
+                                msg,
+                                sender,
+                                client,
+                                photo_tasks,
+                                photo_semaphore
+                            )
+                
+                        if message_data:
+                            messages_data.append(message_data)
                     
-                    if message_data:
-                        messages_data.append(message_data.to_dict())
+                            # Flush a row group when streaming to Parquet
+                            if writer and len(messages_data) >= STREAM_ROW_GROUP_SIZE:
+                                await self._attach_photos(messages_data, photo_tasks)
+                                writer.write_table(messages_data.to_arrow(pa, schema))
+                                messages_data.clear()
                         
-                        # Handle batch processing
-                        if effective_batch_size:
-                            batch_messages.append(message_data.to_dict())
-                            
-                            # Process batch when it reaches the size
-                            if len(batch_messages) >= effective_batch_size:
-                                batch_count += 1
-                                batch_df = pd.DataFrame(batch_messages)
-                                batch_info = {
-                                    'batch_num': batch_count,
-                                    'batch_size': len(batch_messages),
-                                    'total_processed': processed_count + len(batch_messages),
-                                    'group_id': group_id
-                                }
-                                
-                                # Call the batch callback
-                                await batch_callback(batch_df, batch_info)
-                                
-                                # Clear batch buffer
-                                batch_messages = []
-                                
-                                # Apply batch delay to avoid rate limits
-                                if batch_delay > 0:
-                                    logger.info(f"Waiting {batch_delay}s between batches to avoid rate limits...")
-                                    await asyncio.sleep(batch_delay)
-                            
-                        processed_count += 1
+                            # Handle batch processing
+                            if effective_batch_size:
+                                batch_messages.append(message_data)
                         
-                        # Update progress
-                        if progress_tracker:
-                            progress_tracker.update()
+                                # Process batch when it reaches the size
+                                if len(batch_messages) >= effective_batch_size:
+                                    batch_count += 1
+                                    await self._attach_photos(batch_messages, photo_tasks)
+                                    batch_df = batch_messages.to_dataframe()
+                                    batch_info = {
+                                        'batch_num': batch_count,
+                                        'batch_size': len(batch_messages),
+                                        'total_processed': processed_count + len(batch_messages),
+                                        'group_id': group_id
+                                    }
                             
-                        # Log progress
-                        if processed_count % 100 == 0:
-                            logger.info(f"Processed {processed_count} messages...")
+                                    # Call the batch callback
+                                    await batch_callback(batch_df, batch_info)
                             
-                # Process final batch if there are remaining messages
-                if effective_batch_size and batch_messages:
-                    batch_count += 1
-                    batch_df = pd.DataFrame(batch_messages)
-                    batch_info = {
-                        'batch_num': batch_count,
-                        'batch_size': len(batch_messages),
-                        'total_processed': processed_count,
-                        'group_id': group_id,
-                        'is_final': True
-                    }
-                    await batch_callback(batch_df, batch_info)
+                                    # Clear batch buffer
+                                    batch_messages.clear()
                             
-        except FloodWaitError as e:
-            await self.connection_engine.handle_rate_limit(e, client, strategy=rate_limit_strategy)
-            # Retry after rate limit
-            return await self.fetch_messages(
-                group_id=group_id,
-                limit=limit,
-                start_date=start_date,
-                end_date=end_date,
-                include_profile_photos=include_profile_photos,
-                progress_callback=progress_callback,
-                min_id=min_id,
-                batch_size=batch_size,
-                batch_callback=batch_callback
-            )
-            
+                                    # Apply batch delay to avoid rate limits
+                                    if batch_delay > 0:
+                                        logger.info("Waiting %ss between batches to avoid rate limits...", batch_delay)
+                                        await asyncio.sleep(batch_delay)
+                        
+                            processed_count += 1
+                    
+                            # Update progress
+                            if progress_tracker:
+                                progress_tracker.update()
+                        
+                            # Log progress
+                            if processed_count % 100 == 0:
+                                logger.info("Processed %d messages...", processed_count)
+                    break
+                    
+                except FloodWaitError as e:
+                    await self.connection_engine.handle_rate_limit(e, client, strategy=rate_limit_strategy)
+                    if last_seen_id is not None:
+                        # offset_id is exclusive in both directions
+                        iter_kwargs['offset_id'] = last_seen_id
+                        iter_kwargs.pop('offset_date', None)
+                        iter_kwargs['limit'] = total_limit - iterated_count
+                    logger.info("Resuming fetch after message %s", last_seen_id)
+                    
+            # Process final batch if there are remaining messages
+            if effective_batch_size and len(batch_messages):
+                batch_count += 1
+                await self._attach_photos(batch_messages, photo_tasks)
+                batch_df = batch_messages.to_dataframe()
+                batch_info = {
+                    'batch_num': batch_count,
+                    'batch_size': len(batch_messages),
+                    'total_processed': processed_count,
+                    'group_id': group_id,
+                    'is_final': True
+                }
+                await batch_callback(batch_df, batch_info)
+                        
         except Exception as e:
-            logger.error(f"Error fetching messages: {e}")
+            logger.error("Error fetching messages: %s", e)
+            if isinstance(e, (ChannelInvalidError, ChannelPrivateError)):
+                self._entity_cache.pop(_entity_cache_key(group_id), None)
+            for task in (photo_tasks or {}).values():
+                task.cancel()
+            if writer:
+                writer.close()
             raise
             
+        if progress_tracker:
+            progress_tracker.finish()
+            
+        if writer:
+            if len(messages_data):
+                await self._attach_photos(messages_data, photo_tasks)
+                writer.write_table(messages_data.to_arrow(pa, schema))
+            writer.close()
+            logger.info("Streamed %d messages to %s", processed_count, stream_to)
+            return pd.DataFrame()
+            
         # Create DataFrame
-        df = pd.DataFrame(messages_data)
+        await self._attach_photos(messages_data, photo_tasks)
+        df = messages_data.to_dataframe()
         
         # Sort by MessageId when using min_id (for polling)
         if min_id is not None and not df.empty:
             df = df.sort_values('MessageId', ascending=True)
             
-        logger.info(f"Retrieved {len(df)} messages")
+        logger.info("Retrieved %d messages", len(df))
         
             
         return df
@@ -224,45 +552,96 @@ class MessageEngine:
     async def _process_message(self,
                              msg,
                              client,
-                             include_profile_photos: bool) -> Optional[MessageData]:
-        """Process a single message"""
+                             photo_tasks: Optional[Dict[int, asyncio.Future]] = None,
+                             photo_semaphore: Optional[asyncio.Semaphore] = None) -> Optional[MessageData]:
+        """Process a single message, resolving its sender first"""
         try:
-            sender = await msg.get_sender()
-            if not sender:
-                return None
-                
-            # Extract sender info
-            sender_name = f"{getattr(sender, 'first_name', '') or ''} {getattr(sender, 'last_name', '') or ''}".strip()
-            username = f"@{sender.username}" if hasattr(sender, 'username') and sender.username else "No username"
+            sender = await self._get_sender(msg)
+        except Exception as e:
+            logger.error("Error processing message %s: %s", msg.id, e)
+            return None
+            
+        return self._process_message_sync(msg, sender, client, photo_tasks, photo_semaphore)
+        
+    def _process_message_sync(self,
+                              msg,
+                              sender,
+                              client,
+                              photo_tasks: Optional[Dict[int, asyncio.Future]] = None,
+                              photo_semaphore: Optional[asyncio.Semaphore] = None) -> Optional[MessageData]:
+        """
+        Build the MessageData for a message whose sender is already resolved.
+        
+        When photo_tasks is given, a download of the sender's profile photo is
+        scheduled into it (once per sender); the bytes are attached later by
+        _attach_photos.
+        """
+        if not sender:
+            return None
+            
+        try:
+            fwd_from = msg.fwd_from
             
             # Create message data
             message_data = MessageData(
                 message_id=msg.id,
                 sender_id=sender.id,
-                sender_name=sender_name,
-                username=username,
+                sender_name=_sender_name(sender),
+                username=_sender_username(sender),
                 message=msg.message,
                 date=msg.date,
                 reply_to_id=msg.reply_to_msg_id,
-                forwarded_from=msg.fwd_from.from_id if msg.fwd_from else None
+                forwarded_from=fwd_from.from_id if fwd_from is not None else None
             )
             
-            # Download profile photo if requested
-            if include_profile_photos and hasattr(sender, 'photo') and sender.photo:
-                try:
-                    photo_bytes = await client.download_profile_photo(sender, file=bytes)
-                    message_data.photo_data = photo_bytes
-                except Exception as e:
-                    logger.warning(f"Failed to download photo for {sender.id}: {e}")
+            # Schedule profile photo download if requested
+            if (photo_tasks is not None and sender.id not in photo_tasks
+                    and getattr(sender, 'photo', None)):
+                photo_tasks[sender.id] = asyncio.ensure_future(
+                    self._download_photo(client, sender, photo_semaphore)
+                )
                     
             return message_data
             
         except Exception as e:
-            logger.error(f"Error processing message {msg.id}: {e}")
+            logger.error("Error processing message %s: %s", msg.id, e)
             return None
             
+    async def fetch_messages_multi(self,
+                                 group_ids: List[Union[int, str]],
+                                 **kwargs) -> Dict[Union[int, str], pd.DataFrame]:
+        """
+        Fetch messages from several groups concurrently.
+        
+        At most pool_size fetches run at the same time, so with connection
+        pooling each one gets its own connection from the round-robin pool.
+        A group that fails (e.g. a private channel) is logged and left out
+        of the result; the other groups are still returned.
         
+        Args:
+            group_ids: Telegram group/channel IDs or usernames
+            **kwargs: Passed to fetch_messages for every group
             
+        Returns:
+            Dictionary mapping each successfully fetched group ID to its messages DataFrame
+        """
+        semaphore = asyncio.Semaphore(max(1, self.connection_engine.pool_size))
+        
+        async def fetch_one(group_id):
+            async with semaphore:
+                return await self.fetch_messages(group_id=group_id, **kwargs)
+                
+        results = await asyncio.gather(*[fetch_one(group_id) for group_id in group_ids],
+                                       return_exceptions=True)
+        
+        messages = {}
+        for group_id, result in zip(group_ids, results):
+            if isinstance(result, Exception):
+                logger.error("Failed to fetch messages from %s: %s", group_id, result)
+            else:
+                messages[group_id] = result
+        return messages
+        
     async def get_message_count(self, group_id: int) -> int:
         """
         Get total message count for a group.
@@ -276,20 +655,20 @@ class MessageEngine:
         try:
             client = await self.connection_engine.get_client()
             
-            async with client:
-                # Get the messages with limit=1 to access count
-                messages = await client.get_messages(group_id, limit=1)
+            # Get the messages with limit=1 to access count
+            peer = await self._get_input_entity(client, group_id)
+            messages = await client.get_messages(peer, limit=1)
+            
+            # TotalList objects have a 'total' attribute
+            if hasattr(messages, 'total'):
+                return messages.total
+                
+            # If it's just a regular list, we can't get total efficiently
+            logger.warning("Could not get message count efficiently")
+            return 0
                 
-                # TotalList objects have a 'total' attribute
-                if hasattr(messages, 'total'):
-                    return messages.total
-                else:
-                    # If it's just a regular list, we can't get total efficiently
-                    logger.warning("Could not get message count efficiently")
-                    return 0
-                    
         except Exception as e:
-            logger.error(f"Error getting message count: {e}")
+            logger.error("Error getting message count: %s", e)
             raise
             
     async def search_messages(self,
@@ -309,24 +688,23 @@ class MessageEngine:
         """
         try:
             client = await self.connection_engine.get_client()
-            messages_data = []
+            messages_data = _MessageColumns()
             
-            async with client:
-                channel = await client.get_entity(group_id)
-                
-                async for msg in client.iter_messages(
-                    channel,
-                    search=query,
-                    limit=limit
-                ):
-                    message_data = await self._process_message(msg, client, False)
-                    if message_data:
-                        messages_data.append(message_data.to_dict())
-                        
-            df = pd.DataFrame(messages_data)
-            logger.info(f"Found {len(df)} messages matching '{query}'")
+            channel = await self._get_input_entity(client, group_id)
+            
+            async for msg in client.iter_messages(
+                channel,
+                search=query,
+                limit=limit
+            ):
+                message_data = await self._process_message(msg, client)
+                if message_data:
+                    messages_data.append(message_data)
+                    
+            df = messages_data.to_dataframe()
+            logger.info("Found %d messages matching '%s'", len(df), query)
             return df
             
         except Exception as e:
-            logger.error(f"Error searching messages: {e}")
+            logger.error("Error searching messages: %s", e)
             raise
\ No newline at end of file
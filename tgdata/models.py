@@ -2,10 +2,13 @@
 Data models for the Telegram Group Message Crawler.
 """
 
+import sys
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, Any, Dict
 
+# dataclass(slots=True) is only available on Python 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
 
 @dataclass
@@ -28,9 +31,9 @@ class GroupInfo:
     participants_count: Optional[int] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class MessageData:
-    """Structured message data"""
+    """Structured message data (one instance is built per fetched message)"""
     message_id: int
     sender_id: int
     sender_name: str
@@ -2,6 +2,7 @@
 Progress tracking utilities for long-running operations.
 """
 
+import time
 from datetime import datetime, timedelta
 from typing import Optional, Callable
 import logging
@@ -17,23 +18,35 @@ class ProgressTracker:
     
     def __init__(self, 
                  total_expected: Optional[int] = None,
-                 callback: Optional[Callable[[int, Optional[int], float], None]] = None):
+                 callback: Optional[Callable[[int, Optional[int], float], None]] = None,
+                 report_every: int = 1,
+                 time_fn: Callable[[], float] = time.monotonic):
         """
         Initialize progress tracker.
         
         Args:
             total_expected: Expected total items (if known)
             callback: Optional callback function(current, total, rate)
+            report_every: Call the callback once per this many items (default: every item);
+                call finish() at the end to report the final count
+            time_fn: Clock used for rate and elapsed time (default: time.monotonic);
+                tests can pass a fake clock
         """
         self.total_expected = total_expected
         self.callback = callback
+        self.report_every = max(1, report_every)
+        self._time_fn = time_fn
         self.current = 0
         self.start_time: Optional[datetime] = None
+        self._start_clock: Optional[float] = None
+        self._last_reported = 0
         
     def start(self) -> None:
         """Start tracking progress."""
         self.start_time = datetime.now()
+        self._start_clock = self._time_fn()
         self.current = 0
+        self._last_reported = 0
         logger.debug("Progress tracking started")
         
     def update(self, count: int = 1) -> None:
@@ -45,26 +58,32 @@ class ProgressTracker:
         """
         self.current += count
         
-        # Calculate rate
-        if self.start_time:
-            elapsed = (datetime.now() - self.start_time).total_seconds()
-            rate = self.current / elapsed if elapsed > 0 else 0
-        else:
-            rate = 0
+        # Only sample the clock and compute the rate when a report is due
+        if self.current - self._last_reported >= self.report_every:
+            self._report()
             
-        # Call callback
-        if self.callback:
-            try:
-                self.callback(self.current, self.total_expected, rate)
-            except Exception as e:
-                logger.error(f"Progress callback error: {e}")
+    def finish(self) -> None:
+        """Report the final count if it has not been reported yet."""
+        if self.current != self._last_reported:
+            self._report()
+            
+    def _report(self) -> None:
+        """Call the callback with the current count and rate."""
+        self._last_reported = self.current
+        if not self.callback:
+            return
+            
+        try:
+            self.callback(self.current, self.total_expected, self.get_rate())
+        except Exception as e:
+            logger.error(f"Progress callback error: {e}")
         
     def get_rate(self) -> float:
         """Get current processing rate (items per second)."""
-        if not self.start_time:
+        if self._start_clock is None:
             return 0.0
             
-        elapsed = (datetime.now() - self.start_time).total_seconds()
+        elapsed = self._time_fn() - self._start_clock
         return self.current / elapsed if elapsed > 0 else 0.0
         
     def get_eta(self) -> Optional[datetime]:
@@ -83,9 +102,9 @@ class ProgressTracker:
     
     def get_elapsed(self) -> Optional[timedelta]:
         """Get elapsed time since start."""
-        if not self.start_time:
+        if self._start_clock is None:
             return None
-        return datetime.now() - self.start_time
+        return timedelta(seconds=self._time_fn() - self._start_clock)
     
     def get_progress_percentage(self) -> Optional[float]:
         """Get progress as percentage (0-100)."""
@@ -0,0 +1,53 @@
+"""
+Non-blocking console input for the interactive smoke tests
+"""
+
+import asyncio
+import os
+import sys
+import threading
+
+
+def ainput(prompt=""):
+    """
+    Read a line from stdin without blocking the event loop.
+    
+    The line is read in a daemon thread, so Ctrl+C doesn't have to wait for
+    Enter before the interpreter can exit. It uses os.read() rather than
+    input() because a daemon thread blocked inside sys.stdin holds its buffer
+    lock and aborts interpreter shutdown.
+    
+    Args:
+        prompt: Text printed before waiting for input
+        
+    Returns:
+        Future resolving to the line read, without the trailing newline
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    
+    def deliver(line, error):
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(line)
+    
+    def read():
+        line, error = None, None
+        try:
+            data = os.read(sys.stdin.fileno(), 4096)
+            if not data:
+                raise EOFError
+            line = data.decode(errors='replace').rstrip('\r\n')
+        except Exception as e:
+            error = e
+        try:
+            loop.call_soon_threadsafe(deliver, line, error)
+        except RuntimeError:
+            pass  # Event loop already closed
+    
+    print(prompt, end="", flush=True)
+    threading.Thread(target=read, daemon=True).start()
+    return future
@@ -19,22 +19,20 @@ async def extract_to_csv_with_resume(tg: TgData, group_id: int, csv_file: str =
     last_message_id = 0
     existing_count = 0
     
-    if os.path.exists(csv_file):
-        try:
-            # Read just the last row efficiently
-            # In production, you might use: pd.read_csv(csv_file, skiprows=lambda x: x < last_row)
-            df_existing = pd.read_csv(csv_file)
-            if not df_existing.empty:
-                # Get the maximum message ID (in case CSV is not ordered)
-                last_message_id = int(df_existing['MessageId'].max())
-                existing_count = len(df_existing)
-                print(f"📄 Found existing CSV with {existing_count} messages")
-                print(f"📍 Resuming from message ID: {last_message_id}")
-        except Exception as e:
-            print(f"⚠️  Could not read existing CSV: {e}")
-            print("   Starting fresh extraction")
-    else:
+    try:
+        # Only the ID column is needed to find the resume point
+        df_existing = pd.read_csv(csv_file, usecols=['MessageId'])
+        if not df_existing.empty:
+            # Get the maximum message ID (in case CSV is not ordered)
+            last_message_id = int(df_existing['MessageId'].max())
+            existing_count = len(df_existing)
+            print(f"📄 Found existing CSV with {existing_count} messages")
+            print(f"📍 Resuming from message ID: {last_message_id}")
+    except FileNotFoundError:
         print("📄 No existing CSV found, starting fresh extraction")
+    except Exception as e:
+        print(f"⚠️  Could not read existing CSV: {e}")
+        print("   Starting fresh extraction")
     
     # Use get_messages with after_id for incremental extraction
     print(f"\n🔄 Extracting messages since ID {last_message_id}...")
@@ -14,14 +14,12 @@ from tgdata import TgData
 import pandas as pd
 
 
-async def test_default_progress():
+async def test_default_progress(tg):
     """Test with default progress display"""
     print("TEST: Default progress tracking...")
     print("=" * 50)
     
     try:
-        tg = TgData("config.ini")
-        
         # Get groups
         groups = await tg.list_groups()
         if groups.empty:
@@ -54,8 +52,6 @@ async def test_default_progress():
         
         print(f"\n✓ Fetched {len(messages)} messages in {elapsed:.2f} seconds")
         print(f"✓ Average rate: {len(messages)/elapsed:.1f} messages/second")
-        
-        await tg.close()
         return True
         
     except Exception as e:
@@ -65,14 +61,12 @@ async def test_default_progress():
         return False
 
 
-async def test_custom_progress_callback():
+async def test_custom_progress_callback(tg):
     """Test with custom progress callback"""
     print("\n\nTEST: Custom progress callback...")
     print("=" * 50)
     
     try:
-        tg = TgData("config.ini")
-        
         # Get first group
         groups = await tg.list_groups()
         if groups.empty:
@@ -122,8 +116,6 @@ async def test_custom_progress_callback():
                 print(f"  - Min rate: {min(rates):.1f} msg/s")
                 print(f"  - Max rate: {max(rates):.1f} msg/s")
                 print(f"  - Avg rate: {sum(rates)/len(rates):.1f} msg/s")
-        
-        await tg.close()
         return True
         
     except Exception as e:
@@ -133,14 +125,12 @@ async def test_custom_progress_callback():
         return False
 
 
-async def test_progress_with_different_limits():
+async def test_progress_with_different_limits(tg):
     """Test progress tracking with different message limits"""
     print("\n\nTEST: Progress with different limits...")
     print("=" * 50)
     
     try:
-        tg = TgData("config.ini")
-        
         groups = await tg.list_groups()
         if groups.empty:
             print("✗ No groups available")
@@ -174,8 +164,6 @@ async def test_progress_with_different_limits():
             
             print(f"  ✓ Retrieved {len(messages)} messages")
             print(f"  ✓ Callback invoked {callback_count} times")
-        
-        await tg.close()
         return True
         
     except Exception as e:
@@ -185,14 +173,12 @@ async def test_progress_with_different_limits():
         return False
 
 
-async def test_progress_without_callback():
+async def test_progress_without_callback(tg):
     """Test with_progress=True but no callback (uses default)"""
     print("\n\nTEST: Progress without custom callback...")
     print("=" * 50)
     
     try:
-        tg = TgData("config.ini")
-        
         groups = await tg.list_groups()
         if groups.empty:
             print("✗ No groups available")
@@ -212,8 +198,6 @@ async def test_progress_without_callback():
         
         print(f"\n✓ Successfully fetched {len(messages)} messages")
         print("✓ Default progress display should have appeared above")
-        
-        await tg.close()
         return True
         
     except Exception as e:
@@ -223,14 +207,12 @@ async def test_progress_without_callback():
         return False
 
 
-async def test_progress_with_date_filter():
+async def test_progress_with_date_filter(tg):
     """Test progress tracking with date filters"""
     print("\n\nTEST: Progress with date filtering...")
     print("=" * 50)
     
     try:
-        tg = TgData("config.ini")
-        
         groups = await tg.list_groups()
         if groups.empty:
             print("✗ No groups available")
@@ -269,8 +251,6 @@ async def test_progress_with_date_filter():
         
         print(f"\n✓ Found {len(messages)} messages from last 30 days")
         print(f"✓ Progress went through {len(stages)} update stages")
-        
-        await tg.close()
         return True
         
     except Exception as e:
@@ -296,16 +276,18 @@ async def main():
     ]
     
     results = []
-    for test in tests:
-        try:
-            result = await test()
-            results.append(result)
-            await asyncio.sleep(0.5)  # Brief pause between tests
-        except Exception as e:
-            print(f"✗ Test failed with error: {e}")
-            import traceback
-            traceback.print_exc()
-            results.append(False)
+    # One client for all tests, so config parsing and authorization happen once
+    async with TgData("config.ini") as tg:
+        for test in tests:
+            try:
+                result = await test(tg)
+                results.append(result)
+                await asyncio.sleep(0.5)  # Brief pause between tests
+            except Exception as e:
+                print(f"✗ Test failed with error: {e}")
+                import traceback
+                traceback.print_exc()
+                results.append(False)
     
     # Summary
     print("\n\nSummary")
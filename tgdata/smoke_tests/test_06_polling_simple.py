@@ -6,6 +6,7 @@ Smoke tests for polling and real-time message features
 import asyncio
 import sys
 import os
+import traceback
 from datetime import datetime
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
@@ -42,15 +43,14 @@ async def test_polling_basic():
             print(f"  Received {count} new messages")
             if not messages_df.empty:
                 # Show first message
-                first_msg = messages_df.iloc[0]
-                msg_text = first_msg.get('Message', 'No text')[:50]
+                msg_text = messages_df['Message'].iat[0][:50]
                 print(f"  First message: {msg_text}...")
                 # Debug: show message IDs and content
                 print(f"  Message IDs: {messages_df['MessageId'].tolist()}")
                 print(f"  Max ID: {messages_df['MessageId'].max()}")
                 # Show all messages
-                for idx, row in messages_df.iterrows():
-                    print(f"    - ID {row['MessageId']}: {row['Message'][:20]}...")
+                for msg_id, text in zip(messages_df['MessageId'], messages_df['Message']):
+                    print(f"    - ID {msg_id}: {text[:20]}...")
         
         # Get the latest message ID to start polling after
         initial_messages = await tg.get_messages(group_id=test_group_id, limit=1)
@@ -58,7 +58,7 @@ async def test_polling_basic():
         if not initial_messages.empty:
             start_after_id = initial_messages['MessageId'].max()
             print(f"Starting polling after message ID: {start_after_id}")
-            print(f"Latest message: {initial_messages.iloc[0]['Message'][:20]}...")
+            print(f"Latest message: {initial_messages['Message'].iat[0][:20]}...")
         
         # Test polling with 3 iterations
         print("\nPolling for 3 iterations (5 seconds each)...")
@@ -76,7 +76,6 @@ async def test_polling_basic():
         
     except Exception as e:
         print(f"✗ Polling test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -100,7 +99,6 @@ async def main():
             await asyncio.sleep(0.5)
         except Exception as e:
             print(f"✗ Test failed with error: {e}")
-            import traceback
             traceback.print_exc()
             results.append(False)
     
@@ -120,5 +118,11 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Use uvloop's faster event loop when it is installed
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     exit_code = asyncio.run(main())
     sys.exit(exit_code)
\ No newline at end of file
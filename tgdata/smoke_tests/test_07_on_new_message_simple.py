@@ -1,8 +1,9 @@
 """
 Simple test for real-time message events using on_new_message decorator
 """
-# To run: python -m tgdata.smoke_tests.test_07_on_new_message_simple
+# To run: python -m tgdata.smoke_tests.test_07_on_new_message_simple [--mode continuous|timeout]
 
+import argparse
 import asyncio
 import sys
 import os
@@ -61,7 +62,8 @@ async def test_on_new_message():
         # Run the event loop (this will register handlers and start listening)
         await tg.run_with_event_loop()
         
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        # asyncio.run() delivers Ctrl+C to the running coroutine as a cancellation
         print("\n\n" + "=" * 50)
         print("Test stopped by user")
         print(f"Total messages received: {len(received_messages)}")
@@ -135,15 +137,9 @@ async def test_on_new_message_with_timeout():
         return False
 
 
-async def main():
+async def main(mode):
     """Run real-time message tests"""
-    print("Choose test mode:")
-    print("1. Continuous monitoring (Ctrl+C to stop)")
-    print("2. 30-second timeout test")
-    
-    choice = input("Enter choice (1 or 2): ").strip()
-    
-    if choice == "2":
+    if mode == "timeout":
         await test_on_new_message_with_timeout()
     else:
         await test_on_new_message()
@@ -152,8 +148,17 @@ async def main():
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Real-time message event smoke test")
+    parser.add_argument(
+        "--mode",
+        choices=["continuous", "timeout"],
+        default="continuous",
+        help="continuous: monitor until Ctrl+C; timeout: stop after 30 seconds"
+    )
+    args = parser.parse_args()
+    
     try:
-        asyncio.run(main())
+        asyncio.run(main(args.mode))
     except KeyboardInterrupt:
         print("\n✓ Test stopped by user")
-        sys.exit(0)
\ No newline at end of file
+        sys.exit(0)
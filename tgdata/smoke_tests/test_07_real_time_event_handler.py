@@ -7,12 +7,16 @@ import asyncio
 import sys
 import os
 import time
+from collections import OrderedDict
 from datetime import datetime
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from tgdata import TgData
+from tgdata.smoke_tests._async_input import ainput
 import pandas as pd
 
+SENDER_CACHE_SIZE = 1024
+
 
 async def test_basic_event_handler():
     """Test basic real-time event handler"""
@@ -27,18 +31,29 @@ async def test_basic_event_handler():
         # Track received messages
         received_messages = []
         
+        # Sender names by sender ID, so repeat posters don't trigger another lookup
+        sender_cache = OrderedDict()
+        
         # Register event handler for all groups
         @tg.on_new_message()
         async def handle_all_messages(event):
             # Get message details
             try:
-                sender = await event.get_sender()
-                sender_name = getattr(sender, 'first_name', 'Unknown')
+                sender_id = event.sender_id
+                sender_name = sender_cache.get(sender_id)
+                if sender_name is None:
+                    sender = await event.get_sender()
+                    sender_name = getattr(sender, 'first_name', 'Unknown')
+                    sender_cache[sender_id] = sender_name
+                    if len(sender_cache) > SENDER_CACHE_SIZE:
+                        sender_cache.popitem(last=False)
+                else:
+                    sender_cache.move_to_end(sender_id)
                 chat = await event.get_chat()
                 chat_name = getattr(chat, 'title', 'Private Chat')
                 
                 message_info = {
-                    'time': datetime.now().strftime('%H:%M:%S'),
+                    'time': time.strftime('%H:%M:%S'),
                     'chat': chat_name,
                     'sender': sender_name,
                     'text': event.message.text[:50] if event.message.text else '[Media]'
@@ -175,7 +190,7 @@ async def test_multiple_handlers():
         async def display_messages(event):
             chat = await event.get_chat()
             chat_name = getattr(chat, 'title', 'Private')
-            timestamp = datetime.now().strftime('%H:%M:%S')
+            timestamp = time.strftime('%H:%M:%S')
             
             if event.message.text:
                 print(f"[{timestamp}] {chat_name}: {event.message.text[:50]}...")
@@ -239,7 +254,7 @@ async def test_handler_with_filters():
                 sender = await event.get_sender()
                 
                 info = {
-                    'time': datetime.now().strftime('%H:%M:%S'),
+                    'time': time.strftime('%H:%M:%S'),
                     'chat': getattr(chat, 'title', 'Private'),
                     'sender': getattr(sender, 'first_name', 'Unknown'),
                     'keywords': found_keywords,
@@ -383,7 +398,7 @@ async def main():
     
     # Ask if user wants to run tests
     print("Ready to start? The tests will listen for real messages.")
-    input("Press Enter to begin...")
+    await ainput("Press Enter to begin...")
     print()
     
     results = []
@@ -395,8 +410,9 @@ async def main():
             # Pause between tests
             if test != tests[-1]:
                 print("\nPress Enter for next test...")
-                input()
-        except KeyboardInterrupt:
+                await ainput()
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            # asyncio.run() delivers Ctrl+C to the running coroutine as a cancellation
             print("\n\nTests interrupted by user")
             break
         except Exception as e:
@@ -429,5 +445,8 @@ if __name__ == "__main__":
     print("Starting real-time event handler tests...")
     print("Note: You'll need to send actual messages to test this feature!\n")
     
-    exit_code = asyncio.run(main())
+    try:
+        exit_code = asyncio.run(main())
+    except KeyboardInterrupt:
+        exit_code = 1
     sys.exit(exit_code)
\ No newline at end of file
@@ -59,8 +59,7 @@ async def test_batch_callback_basic():
             
             # Show sample message from batch
             if not batch_df.empty:
-                first_msg = batch_df.iloc[0]
-                msg_text = first_msg.get('Message', 'No text')[:50]
+                msg_text = batch_df['Message'].iat[0][:50]
                 print(f"    - First message: {msg_text}...")
         
         print("\nFetching messages in batches of 50...")
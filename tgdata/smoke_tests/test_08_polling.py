@@ -6,6 +6,7 @@ Smoke tests for polling and real-time message features
 import asyncio
 import sys
 import os
+import traceback
 from datetime import datetime
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
@@ -13,17 +14,13 @@ from tgdata import TgData
 import pandas as pd
 
 
-async def test_polling_basic():
+async def test_polling_basic(tg, groups):
     """Test basic polling functionality"""
     print("TEST: Basic polling functionality...")
     
     try:
-        # Initialize TgData
-        tg = TgData("config.ini")
-        
         # Get a test group
-        groups = await tg.list_groups()
-        if groups.empty:
+        if len(groups) == 0:
             print("✗ No groups available for testing")
             return False
             
@@ -38,16 +35,15 @@ async def test_polling_basic():
             count = len(messages_df)
             messages_received.append(count)
             print(f"  Received {count} new messages")
-            if not messages_df.empty:
+            if len(messages_df) > 0:
                 # Show first message
-                first_msg = messages_df.iloc[0]
-                msg_text = first_msg.get('Message', 'No text')[:50]
+                msg_text = messages_df['Message'].iat[0][:50]
                 print(f"  First message: {msg_text}...")
         
         # Get the latest message ID to start polling after
         initial_messages = await tg.get_messages(group_id=test_group_id, limit=1)
         start_after_id = 0
-        if not initial_messages.empty:
+        if len(initial_messages) > 0:
             start_after_id = initial_messages['MessageId'].max()
             print(f"Starting polling after message ID: {start_after_id}")
         
@@ -62,27 +58,21 @@ async def test_polling_basic():
         )
         
         print(f"✓ Polling completed. Total polls that found messages: {len(messages_received)}")
-        await tg.close()
         return True
         
     except Exception as e:
         print(f"✗ Polling test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
 
-async def test_event_handler():
+async def test_event_handler(tg, groups):
     """Test real-time event handler"""
     print("\nTEST: Real-time event handler...")
     
     try:
-        # Initialize TgData
-        tg = TgData("config.ini")
-        
         # Get a test group
-        groups = await tg.list_groups()
-        if groups.empty:
+        if len(groups) == 0:
             print("✗ No groups available for testing")
             return False
             
@@ -107,24 +97,19 @@ async def test_event_handler():
         print("  1. Call await tg.run_with_event_loop() to start listening")
         print("  2. Send messages to the group from another account")
         print("  3. See the messages appear in real-time")
-        
-        await tg.close()
         return True
         
     except Exception as e:
         print(f"✗ Event handler test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
 
-async def test_polling_error_handling():
+async def test_polling_error_handling(tg, groups):
     """Test polling with a real group"""
     print("\nTEST: Polling with real group...")
     
     try:
-        tg = TgData("config.ini")
-        
         # Use a real group ID
         # test_group_id = 1670178185
         test_group_id =2367653179
@@ -150,29 +135,22 @@ async def test_polling_error_handling():
         print(f"✓ Total polls that found messages: {len(messages_found)}")
         if messages_found:
             print(f"✓ Total messages found: {sum(messages_found)}")
-        
-        await tg.close()
         return True
         
     except Exception as e:
         print(f"✗ Polling test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
 
-async def test_multiple_handlers():
+async def test_multiple_handlers(tg, groups):
     """Test multiple event handlers"""
     print("\nTEST: Multiple event handlers...")
     
     try:
-        tg = TgData("config.ini")
-        
         # Get test groups
-        groups = await tg.list_groups()
         if len(groups) < 2:
             print("! Need at least 2 groups for this test, skipping")
-            await tg.close()
             return True
             
         group1_id = int(groups.iloc[0]['GroupID'])
@@ -192,13 +170,115 @@ async def test_multiple_handlers():
         
         print(f"✓ Registered handler for group {group1_id}")
         print("✓ Registered handler for all groups")
-        
-        await tg.close()
         return True
         
     except Exception as e:
         print(f"✗ Multiple handlers test failed: {e}")
-        import traceback
+        traceback.print_exc()
+        return False
+
+
+async def test_poll_groups(tg, groups):
+    """Test polling several groups from one loop"""
+    print("\nTEST: Polling several groups...")
+    
+    try:
+        if len(groups) < 2:
+            print("! Need at least 2 groups for this test, skipping")
+            return True
+            
+        group_ids = [int(group_id) for group_id in groups['GroupID'].iloc[:2]]
+        
+        # Start each group a few messages back so the first poll finds something
+        after_ids = {}
+        for group_id in group_ids:
+            recent = await tg.get_messages(group_id=group_id, limit=5)
+            after_ids[group_id] = int(recent['MessageId'].min()) if len(recent) > 1 else 0
+        print(f"Starting after IDs: {after_ids}")
+        
+        delivered = {group_id: [] for group_id in group_ids}
+        
+        async def group_callback(group_id, messages_df):
+            assert group_id in delivered, f"Callback got unknown group {group_id}"
+            assert isinstance(messages_df, pd.DataFrame)
+            delivered[group_id].extend(messages_df['MessageId'].tolist())
+            print(f"  Group {group_id}: {len(messages_df)} new messages")
+        
+        await tg.poll_groups(
+            group_ids=group_ids,
+            interval=2,
+            after_ids=after_ids,
+            callback=group_callback,
+            max_iterations=2
+        )
+        
+        for group_id in group_ids:
+            ids = delivered[group_id]
+            # Each group's after_id advances on its own: nothing at or before
+            # its starting point, and nothing delivered twice
+            assert all(message_id > after_ids[group_id] for message_id in ids)
+            assert len(ids) == len(set(ids)), f"Group {group_id} got duplicate messages"
+            if after_ids[group_id]:
+                assert ids, f"Group {group_id} got no messages after {after_ids[group_id]}"
+        
+        print("✓ Callback received (group_id, DataFrame) for each group")
+        print("✓ Each group's after_id advanced independently without duplicates")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Multi-group polling test failed: {e}")
+        traceback.print_exc()
+        return False
+
+
+async def test_polling_with_events(tg, groups):
+    """Test event-assisted polling (use_events=True)"""
+    print("\nTEST: Event-assisted polling...")
+    
+    try:
+        if len(groups) == 0:
+            print("✗ No groups available for testing")
+            return False
+            
+        test_group_id = int(groups.iloc[0]['GroupID'])
+        print(f"Testing with group ID: {test_group_id}")
+        
+        client = await tg.connection_engine.get_client()
+        handlers_before = len(client.list_event_handlers())
+        
+        polls_with_messages = []
+        
+        async def message_callback(messages_df):
+            polls_with_messages.append(len(messages_df))
+            print(f"  Received {len(messages_df)} new messages")
+        
+        async def count_handlers_while_polling():
+            await asyncio.sleep(1)
+            return len(client.list_event_handlers())
+        
+        # A new message in the group would wake the loop before the 3s interval
+        print("Polling for 2 iterations (3 seconds each, or sooner on new messages)...")
+        handlers_during, _ = await asyncio.gather(
+            count_handlers_while_polling(),
+            tg.poll_for_messages(
+                group_id=test_group_id,
+                interval=3,
+                callback=message_callback,
+                max_iterations=2,
+                use_events=True
+            )
+        )
+        handlers_after = len(client.list_event_handlers())
+        
+        assert handlers_during == handlers_before + 1, "Wake handler was not registered while polling"
+        print("✓ Wake handler registered while polling")
+        assert handlers_after == handlers_before, "Wake handler was not removed after polling"
+        print("✓ Wake handler removed when polling finished")
+        print(f"✓ Polls that found messages: {len(polls_with_messages)}")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Event-assisted polling test failed: {e}")
         traceback.print_exc()
         return False
 
@@ -212,20 +292,26 @@ async def main():
         test_polling_basic,
         test_event_handler,
         test_polling_error_handling,
-        test_multiple_handlers
+        test_multiple_handlers,
+        test_poll_groups,
+        test_polling_with_events
     ]
     
+    # All tests share one client (separate clients would contend for the
+    # same session file) and one group list
     results = []
-    for test in tests:
-        try:
-            result = await test()
-            results.append(result)
-            await asyncio.sleep(0.5)
-        except Exception as e:
-            print(f"✗ Test failed with error: {e}")
-            import traceback
-            traceback.print_exc()
-            results.append(False)
+    async with TgData("config.ini") as tg:
+        # Fetch the group list once instead of one GetDialogs per test
+        groups = await tg.list_groups()
+        
+        for test in tests:
+            try:
+                result = await test(tg, groups)
+                results.append(result)
+            except Exception as e:
+                print(f"✗ Test failed with error: {e}")
+                traceback.print_exc()
+                results.append(False)
     
     # Summary
     print("\nSummary")
@@ -243,5 +329,11 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Use uvloop's faster event loop when it is installed
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     exit_code = asyncio.run(main())
     sys.exit(exit_code)
\ No newline at end of file
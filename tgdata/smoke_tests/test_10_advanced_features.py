@@ -7,6 +7,7 @@ import asyncio
 import sys
 import os
 import tempfile
+import traceback
 from datetime import datetime, timedelta
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
@@ -21,16 +22,16 @@ async def test_connection_pooling():
     print("\nTEST: Connection pooling...")
     try:
         # Test pool configuration
-        tg = TgData(connection_pool_size=5)
-        assert tg.connection_engine.pool_size == 5
-        print("✓ Connection pool size configured")
-        
-        # Test health check structure
-        health = await tg.health_check()
-        assert isinstance(health, dict)
-        assert 'timestamp' in health
-        assert 'pool_connections' in health
-        print("✓ Health check includes pool information")
+        async with TgData(connection_pool_size=5) as tg:
+            assert tg.connection_engine.pool_size == 5
+            print("✓ Connection pool size configured")
+            
+            # Test health check structure
+            health = await tg.health_check()
+            assert isinstance(health, dict)
+            assert 'timestamp' in health
+            assert 'pool_connections' in health
+            print("✓ Health check includes pool information")
         
         return True
     except Exception as e:
@@ -42,32 +43,31 @@ async def test_progress_tracking():
     """Test progress tracking functionality"""
     print("\nTEST: Progress tracking...")
     try:
-        tg = TgData()
-        
-        # Test that get_messages supports progress tracking
-        assert hasattr(tg, 'get_messages')
-        
-        # Test progress callback structure
-        progress_data = []
-        
-        def test_callback(current, total, rate):
-            progress_data.append({
-                'current': current,
-                'total': total,
-                'rate': rate
-            })
-        
-        # We can't actually fetch messages without auth, but we can test the parameter acceptance
-        try:
-            await tg.get_messages(
-                group_id=12345,
-                limit=10,
-                with_progress=True,
-                progress_callback=test_callback
-            )
-        except:
-            # Expected to fail without auth
-            pass
+        async with TgData() as tg:
+            # Test that get_messages supports progress tracking
+            assert hasattr(tg, 'get_messages')
+            
+            # Test progress callback structure
+            progress_data = []
+            
+            def test_callback(current, total, rate):
+                progress_data.append({
+                    'current': current,
+                    'total': total,
+                    'rate': rate
+                })
+            
+            # We can't actually fetch messages without auth, but we can test the parameter acceptance
+            try:
+                await tg.get_messages(
+                    group_id=12345,
+                    limit=10,
+                    with_progress=True,
+                    progress_callback=test_callback
+                )
+            except:
+                # Expected to fail without auth
+                pass
         
         print("✓ Progress tracking parameters accepted")
         
@@ -82,16 +82,17 @@ async def test_date_filtering():
     print("\nTEST: Date filtering...")
     try:
         tg = TgData()
+        now = datetime.now()
         
         # Test filter_messages with date parameters
         df = pd.DataFrame({
             'MessageId': [1, 2, 3, 4, 5],
             'Date': [
-                datetime.now() - timedelta(days=5),
-                datetime.now() - timedelta(days=3),
-                datetime.now() - timedelta(days=1),
-                datetime.now(),
-                datetime.now() + timedelta(days=1)
+                now - timedelta(days=5),
+                now - timedelta(days=3),
+                now - timedelta(days=1),
+                now,
+                now + timedelta(days=1)
             ],
             'Message': ['Old', 'Mid', 'Recent', 'Today', 'Future']
         })
@@ -99,7 +100,7 @@ async def test_date_filtering():
         # Filter last 2 days
         filtered = tg.filter_messages(
             df,
-            start_date=datetime.now() - timedelta(days=2)
+            start_date=now - timedelta(days=2)
         )
         assert len(filtered) == 3  # Recent, Today, Future
         print("✓ Start date filtering works")
@@ -107,7 +108,7 @@ async def test_date_filtering():
         # Filter with end date
         filtered = tg.filter_messages(
             df,
-            end_date=datetime.now()
+            end_date=now
         )
         assert len(filtered) == 4  # Excludes Future
         print("✓ End date filtering works")
@@ -115,8 +116,8 @@ async def test_date_filtering():
         # Filter date range
         filtered = tg.filter_messages(
             df,
-            start_date=datetime.now() - timedelta(days=4),
-            end_date=datetime.now() - timedelta(days=2)
+            start_date=now - timedelta(days=4),
+            end_date=now - timedelta(days=2)
         )
         assert len(filtered) == 1  # Only Mid
         print("✓ Date range filtering works")
@@ -149,7 +150,6 @@ async def test_message_caching():
         return True
     except Exception as e:
         print(f"✗ Message caching test failed: {e}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -188,19 +188,18 @@ async def test_validation_methods():
     """Test connection validation methods"""
     print("\nTEST: Validation methods...")
     try:
-        tg = TgData()
-        
-        # Test validate_connection
-        is_valid = await tg.validate_connection()
-        assert isinstance(is_valid, bool)
-        print(f"✓ Connection validation returns: {is_valid}")
-        
-        # Test health check
-        health = await tg.health_check()
-        assert isinstance(health, dict)
-        assert 'primary_connection' in health
-        assert 'errors' in health
-        print("✓ Health check returns detailed status")
+        async with TgData() as tg:
+            # Test validate_connection
+            is_valid = await tg.validate_connection()
+            assert isinstance(is_valid, bool)
+            print(f"✓ Connection validation returns: {is_valid}")
+            
+            # Test health check
+            health = await tg.health_check()
+            assert isinstance(health, dict)
+            assert 'primary_connection' in health
+            assert 'errors' in health
+            print("✓ Health check returns detailed status")
         
         return True
     except Exception as e:
@@ -229,7 +228,6 @@ async def main():
             results.append(result)
         except Exception as e:
             print(f"✗ Test failed with error: {e}")
-            import traceback
             traceback.print_exc()
             results.append(False)
     
@@ -0,0 +1,103 @@
+"""
+Smoke test for streaming messages to a Parquet file
+"""
+# To run: python -m tgdata.smoke_tests.test_11_stream_to_parquet
+
+import asyncio
+import sys
+import os
+import tempfile
+import traceback
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from tgdata import TgData
+import pandas as pd
+
+EXPECTED_COLUMNS = [
+    'MessageId', 'SenderId', 'Name', 'Username', 'Message',
+    'Date', 'ReplyToId', 'ForwardedFrom', 'PhotoData'
+]
+
+
+def pyarrow_available():
+    """Check whether the optional pyarrow dependency is installed"""
+    try:
+        import pyarrow  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+async def test_stream_to_parquet(tg, test_group_id):
+    """Stream a group to Parquet and compare it with an in-memory fetch"""
+    print("TEST: Stream messages to Parquet")
+    print("=" * 50)
+    
+    try:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "messages.parquet")
+            
+            # Streaming returns an empty DataFrame and writes the file instead
+            result = await tg.get_messages(group_id=test_group_id, limit=200, stream_to=path)
+            assert len(result) == 0, "stream_to should return an empty DataFrame"
+            assert os.path.exists(path), "Parquet file was not written"
+            print("✓ Parquet file written, empty DataFrame returned")
+            
+            streamed = pd.read_parquet(path)
+            print(f"  Rows in file: {len(streamed)}")
+            
+            # Same fetch in memory for comparison
+            in_memory = await tg.get_messages(group_id=test_group_id, limit=200)
+            assert len(streamed) == len(in_memory), \
+                f"Row count mismatch: {len(streamed)} streamed vs {len(in_memory)} in memory"
+            print(f"✓ Row count matches in-memory fetch ({len(in_memory)})")
+            
+            # Schema
+            assert list(streamed.columns) == EXPECTED_COLUMNS, f"Unexpected columns: {list(streamed.columns)}"
+            assert streamed['MessageId'].dtype == 'int64'
+            assert pd.api.types.is_datetime64_any_dtype(streamed['Date'])
+            print("✓ Columns and dtypes match the message schema")
+            
+            if len(streamed) > 0:
+                assert set(streamed['MessageId']) == set(in_memory['MessageId'])
+                print("✓ Same message IDs as the in-memory fetch")
+        
+        return True
+    
+    except Exception as e:
+        print(f"✗ Stream to Parquet test failed: {e}")
+        traceback.print_exc()
+        return False
+
+
+async def main():
+    """Run the Parquet streaming test"""
+    print("Stream to Parquet Feature Test")
+    print("=" * 50)
+    
+    if not pyarrow_available():
+        print("⚠ pyarrow is not installed (pip install tgdata[parquet]), skipping")
+        return 0
+    
+    async with TgData("config.ini") as tg:
+        groups = await tg.list_groups()
+        if len(groups) == 0:
+            print("✗ No groups available for testing")
+            return 1
+        
+        test_group = groups.iloc[0]
+        print(f"Using group: {test_group['Title']} (ID: {test_group['GroupID']})\n")
+        
+        passed = await test_stream_to_parquet(tg, int(test_group['GroupID']))
+    
+    if passed:
+        print("\n✓ Stream to Parquet test passed!")
+        return 0
+    else:
+        print("\n✗ Stream to Parquet test failed")
+        return 1
+
+
+if __name__ == "__main__":
+    exit_code = asyncio.run(main())
+    sys.exit(exit_code)
@@ -0,0 +1,78 @@
+"""
+Smoke test for fetching several groups at once
+"""
+# To run: python -m tgdata.smoke_tests.test_12_get_messages_multi
+
+import asyncio
+import sys
+import os
+import traceback
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from tgdata import TgData
+import pandas as pd
+
+# A username that is not expected to resolve to any group
+INVALID_GROUP = "@tgdata_no_such_group_000"
+
+
+async def test_get_messages_multi(tg, group_ids):
+    """Fetch two groups plus an invalid one and check the invalid one is left out"""
+    print("TEST: get_messages_multi with one invalid group")
+    print("=" * 50)
+    
+    try:
+        requested = group_ids + [INVALID_GROUP]
+        results = await tg.get_messages_multi(group_ids=requested, limit=20)
+        
+        for group_id, messages in results.items():
+            print(f"  {group_id}: {len(messages)} messages")
+        
+        # Every valid group comes back as a DataFrame
+        for group_id in group_ids:
+            assert group_id in results, f"Missing result for group {group_id}"
+            assert isinstance(results[group_id], pd.DataFrame)
+            assert len(results[group_id]) <= 20
+        print(f"✓ All {len(group_ids)} valid groups returned")
+        
+        # The failing group is left out instead of failing the whole call
+        assert INVALID_GROUP not in results, "Invalid group should be left out of the results"
+        print("✓ Invalid group left out, other groups still returned")
+        
+        return True
+    
+    except Exception as e:
+        print(f"✗ get_messages_multi test failed: {e}")
+        traceback.print_exc()
+        return False
+
+
+async def main():
+    """Run the multi-group fetch test"""
+    print("Multi-group Fetch Feature Test")
+    print("=" * 50)
+    
+    # Default pool size, so the groups are fetched one after another on the
+    # existing session (a larger pool opens extra session files)
+    async with TgData("config.ini") as tg:
+        groups = await tg.list_groups()
+        if len(groups) < 2:
+            print("✗ Need at least 2 groups for this test")
+            return 1
+        
+        group_ids = [int(group_id) for group_id in groups['GroupID'].iloc[:2]]
+        print(f"Using groups: {group_ids}\n")
+        
+        passed = await test_get_messages_multi(tg, group_ids)
+    
+    if passed:
+        print("\n✓ Multi-group fetch test passed!")
+        return 0
+    else:
+        print("\n✗ Multi-group fetch test failed")
+        return 1
+
+
+if __name__ == "__main__":
+    exit_code = asyncio.run(main())
+    sys.exit(exit_code)
@@ -10,6 +10,7 @@ from datetime import datetime
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from tgdata import TgData
+from tgdata.smoke_tests._async_input import ainput
 import pandas as pd
 import logging
 
@@ -41,7 +42,8 @@ async def test_polling_debug():
             print(f"   Latest message: {all_messages[all_messages['MessageId'] == latest_id]['Message'].iloc[0][:50]}...")
         
         print("\n2. Now send some test messages to the group and press Enter when done...")
-        input("   Press Enter after sending messages: ")
+        # Wait without blocking the loop so the connected client keeps running
+        await ainput("   Press Enter after sending messages: ")
         
         # Get messages again to see what was added
         print("\n3. Getting ALL messages again to see what was added...")
@@ -187,4 +189,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        print("\nStopped by user")
\ No newline at end of file
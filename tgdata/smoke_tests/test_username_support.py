@@ -28,34 +28,40 @@ async def test_username_support():
         # You can add more test cases with groups you have access to
     ]
     
+    async def resolve(identifier):
+        # Try to get the entity, then fetch a few messages to confirm it works
+        entity = await client.get_entity(identifier)
+        messages = []
+        async for msg in client.iter_messages(entity, limit=3):
+            if msg.text:
+                messages.append(msg.text[:30])
+        return entity, messages
+    
     async with client:
-        for description, identifier in test_cases:
+        # Resolve every identifier concurrently; failures are reported per case
+        results = await asyncio.gather(
+            *(resolve(identifier) for _, identifier in test_cases),
+            return_exceptions=True
+        )
+        
+        for (description, identifier), result in zip(test_cases, results):
             print(f"\nTest: {description}")
             print(f"  Identifier: {identifier}")
             
-            try:
-                # Try to get the entity
-                entity = await client.get_entity(identifier)
-                
+            if isinstance(result, ValueError):
+                print(f"  ✗ Failed (ValueError): {result}")
+                print(f"    This usually means the entity wasn't found or you don't have access")
+            elif isinstance(result, Exception):
+                print(f"  ✗ Failed ({type(result).__name__}): {result}")
+            else:
+                entity, messages = result
                 print(f"  ✓ Success!")
                 print(f"    - Title: {entity.title}")
                 print(f"    - ID: {entity.id}")
                 print(f"    - Username: @{entity.username if hasattr(entity, 'username') and entity.username else 'None'}")
                 
-                # Try to fetch a few messages to confirm it works
-                messages = []
-                async for msg in client.iter_messages(entity, limit=3):
-                    if msg.text:
-                        messages.append(msg.text[:30])
-                
                 if messages:
                     print(f"    - Sample messages retrieved: {len(messages)}")
-                
-            except ValueError as e:
-                print(f"  ✗ Failed (ValueError): {e}")
-                print(f"    This usually means the entity wasn't found or you don't have access")
-            except Exception as e:
-                print(f"  ✗ Failed ({type(e).__name__}): {e}")
     
     # Now test with tgdata's get_messages directly
     print("\n" + "=" * 50)
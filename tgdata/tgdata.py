@@ -4,10 +4,11 @@ Single class with all features, delegating to specialized engines.
 """
 
 import asyncio
+import functools
 import json
 import logging
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any, Union, Callable
+from typing import Optional, List, Dict, Any, Union, Callable, Tuple
 import pandas as pd
 
 from .connection_engine import ConnectionEngine
@@ -81,29 +82,28 @@ class TgData:
             client = await self.connection_engine.get_client()
             groups_data = []
             
-            async with client:
-                async for dialog in client.iter_dialogs():
-                    if dialog.is_group or dialog.is_channel:
-                        entity = dialog.entity
-                        
-                        group_info = {
-                            'GroupID': entity.id,
-                            'Title': entity.title,
-                            'Username': f"@{entity.username}" if hasattr(entity, 'username') and entity.username else None,
-                            'Identifier': f"@{entity.username}" if hasattr(entity, 'username') and entity.username else str(entity.id),
-                            'IsChannel': dialog.is_channel,
-                            'IsMegagroup': getattr(entity, 'megagroup', False),
-                            'ParticipantsCount': getattr(entity, 'participants_count', None)
-                        }
-                        
-                        groups_data.append(group_info)
-                        
+            async for dialog in client.iter_dialogs():
+                if dialog.is_group or dialog.is_channel:
+                    entity = dialog.entity
+                    
+                    group_info = {
+                        'GroupID': entity.id,
+                        'Title': entity.title,
+                        'Username': f"@{entity.username}" if hasattr(entity, 'username') and entity.username else None,
+                        'Identifier': f"@{entity.username}" if hasattr(entity, 'username') and entity.username else str(entity.id),
+                        'IsChannel': dialog.is_channel,
+                        'IsMegagroup': getattr(entity, 'megagroup', False),
+                        'ParticipantsCount': getattr(entity, 'participants_count', None)
+                    }
+                    
+                    groups_data.append(group_info)
+                    
             df = pd.DataFrame(groups_data)
-            logger.info(f"Found {len(df)} groups/channels")
+            logger.info("Found %d groups/channels", len(df))
             return df
             
         except Exception as e:
-            logger.error(f"Error listing groups: {e}")
+            logger.error("Error listing groups: %s", e)
             raise
             
     def set_group(self, group_id: int) -> None:
@@ -118,7 +118,7 @@ class TgData:
             title="",  # Will be populated on first operation
             username=None
         )
-        logger.info(f"Set current group to {group_id}")
+        logger.info("Set current group to %s", group_id)
         
     # ==================== Message Operations ====================
     
@@ -134,7 +134,10 @@ class TgData:
                           batch_size: Optional[int] = None,
                           batch_callback: Optional[Callable] = None,
                           batch_delay: float = 0.0,
-                          rate_limit_strategy: str = 'wait') -> pd.DataFrame:
+                          rate_limit_strategy: str = 'wait',
+                          stream_to: Optional[str] = None,
+                          aggressive: bool = False,
+                          progress_every: int = 1) -> pd.DataFrame:
         """
         Get messages from a group with various options.
         
@@ -151,9 +154,15 @@ class TgData:
             batch_callback: Optional async callback called for each batch (batch_df, batch_info)
             batch_delay: Delay in seconds between batches to avoid rate limits (default: 0)
             rate_limit_strategy: How to handle rate limits - 'wait' or 'exponential' (default: 'wait')
+            stream_to: Optional Parquet file path to stream messages to instead of
+                building the DataFrame in memory (requires pyarrow)
+            aggressive: Skip Telethon's flood-protection sleep between history
+                requests (default: False)
+            progress_every: Report progress once per this many messages; the final
+                count is always reported (default: 1)
             
         Returns:
-            DataFrame with messages
+            DataFrame with messages, or an empty DataFrame when stream_to is given
         """
         # Use provided group_id or current
         target_group_id = group_id or (self.current_group.id if self.current_group else None)
@@ -187,7 +196,10 @@ class TgData:
             batch_size=batch_size,
             batch_callback=batch_callback,
             batch_delay=batch_delay,
-            rate_limit_strategy=rate_limit_strategy
+            rate_limit_strategy=rate_limit_strategy,
+            stream_to=stream_to,
+            aggressive=aggressive,
+            progress_every=progress_every
         )
         
         if with_progress:
@@ -195,6 +207,40 @@ class TgData:
          
         return df
         
+    async def get_messages_multi(self,
+                                 group_ids: List[Union[int, str]],
+                                 limit: Optional[int] = None,
+                                 start_date: Optional[datetime] = None,
+                                 end_date: Optional[datetime] = None,
+                                 after_id: int = 0,
+                                 include_profile_photos: bool = False) -> Dict[Union[int, str], pd.DataFrame]:
+        """
+        Get messages from several groups concurrently.
+        
+        Up to connection_pool_size groups are fetched at the same time, so with
+        the default connection_pool_size=1 they are fetched one after another.
+        Groups that fail are logged and left out of the result.
+        
+        Args:
+            group_ids: Target group IDs or usernames
+            limit: Maximum number of messages per group
+            start_date: Get messages after this date
+            end_date: Get messages before this date
+            after_id: Get messages after this message ID in every group
+            include_profile_photos: Whether to download profile photos
+            
+        Returns:
+            Dictionary mapping each successfully fetched group ID to its messages DataFrame
+        """
+        return await self.message_engine.fetch_messages_multi(
+            group_ids,
+            limit=limit,
+            start_date=start_date,
+            end_date=end_date,
+            min_id=after_id + 1 if after_id > 0 else None,  # +1 to exclude the after_id message itself
+            include_profile_photos=include_profile_photos
+        )
+        
         
     async def get_message_count(self, group_id: Optional[int] = None) -> int:
         """
@@ -261,7 +307,7 @@ class TgData:
         print(f"Displaying {len(messages_to_print)} of {len(df)} messages")
         print(f"{'='*80}\n")
         
-        for _, msg in messages_to_print.iterrows():
+        for msg in messages_to_print.to_dict('records'):
             print(format_message_for_display(msg, max_length))
             print(f"{'-'*80}")
             
@@ -360,10 +406,14 @@ class TgData:
         """
         metrics = await self.get_metrics()
         
-        with open(filepath, 'w') as f:
-            json.dump(metrics, f, indent=2)
+        def write_metrics():
+            with open(filepath, 'w') as f:
+                json.dump(metrics, f, indent=2)
+                
+        # Write from a worker thread so disk I/O doesn't block the event loop
+        await asyncio.get_running_loop().run_in_executor(None, write_metrics)
             
-        logger.info(f"Exported metrics to {filepath}")
+        logger.info("Exported metrics to %s", filepath)
         
     # ==================== Utility Methods ====================
     
@@ -423,7 +473,7 @@ class TgData:
                 self._pending_handlers = []
             
             self._pending_handlers.append((func, group_id))
-            logger.info(f"Queued handler for group {group_id or 'all groups'}")
+            logger.info("Queued handler for group %s", group_id or 'all groups')
             
             return func
         
@@ -453,16 +503,71 @@ class TgData:
             else:
                 client.add_event_handler(handler, events.NewMessage())
             
-            logger.info(f"Registered handler for group {group_id or 'all groups'}")
+            logger.info("Registered handler for group %s", group_id or 'all groups')
         
         self._pending_handlers.clear()
     
+    async def _poll_once(self,
+                         group_id: Union[int, str],
+                         after_id: int,
+                         callback: Optional[Callable],
+                         iteration: int) -> Tuple[int, bool]:
+        """
+        Run a single poll for one group.
+        
+        Args:
+            group_id: Group ID or username to poll
+            after_id: Message ID to look for messages after
+            callback: Optional async callback receiving the new messages DataFrame
+            iteration: Poll iteration number (for logging)
+            
+        Returns:
+            Tuple of (updated after_id, whether new messages were found)
+        """
+        # Get new messages since last check
+        logger.info("Poll iteration %d: Checking for messages after ID %s", iteration, after_id)
+        new_messages = await self.get_messages(
+            group_id=group_id,
+            after_id=after_id
+        )
+        
+        if len(new_messages) == 0:
+            logger.debug("Poll iteration %d: No new messages", iteration)
+            return after_id, False
+            
+        # Every ID delivered so far is <= after_id, so the watermark
+        # alone identifies already seen messages (no ever-growing ID set)
+        message_ids = new_messages['MessageId']
+        truly_new_messages = new_messages[message_ids > after_id]
+        max_id = int(message_ids.max())
+        
+        if len(truly_new_messages) == 0:
+            # All messages were duplicates, but still update after_id to the max
+            logger.info("Poll iteration %d: Found %d messages but all were duplicates", iteration, len(new_messages))
+            logger.info("Updating after_id from %s to %s", after_id, max_id)
+            return max_id, False
+            
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Poll iteration %d: Found %d new messages, IDs: %s",
+                        iteration, len(truly_new_messages), sorted(truly_new_messages['MessageId'].tolist()))
+        
+        # Simply update to the maximum ID we've seen
+        logger.info("Updating after_id from %s to %s", after_id, max_id)
+        
+        # Call the callback only with truly new messages
+        if callback:
+            await callback(truly_new_messages)
+            
+        return max_id, True
+    
     async def poll_for_messages(self, 
                                group_id: Union[int, str],
                                interval: int = 60,
                                after_id: int = 0,
                                callback: Optional[Callable] = None,
-                               max_iterations: Optional[int] = None) -> None:
+                               max_iterations: Optional[int] = None,
+                               max_interval: Optional[float] = None,
+                               use_events: bool = False) -> None:
         """
         Poll for new messages at specified intervals.
         
@@ -472,6 +577,13 @@ class TgData:
             after_id: Message ID to start polling after (default: 0)
             callback: Optional async callback function to process new messages
             max_iterations: Maximum number of polling iterations (None = infinite)
+            max_interval: If set, enables adaptive polling - the interval grows by 1.5x
+                after each poll without new messages (up to max_interval) and
+                resets to interval as soon as new messages arrive. Must not be
+                smaller than interval
+            use_events: If True, a Telegram new-message update for the group wakes the
+                loop immediately instead of waiting for the interval to pass. The
+                interval is still used as a fallback, so missed updates are caught up
             
         Example:
             async def process_messages(messages_df):
@@ -483,64 +595,131 @@ class TgData:
                 callback=process_messages
             )
         """
-        logger.info(f"Starting polling for group {group_id} with interval {interval}s")
+        if max_interval is not None and max_interval < interval:
+            raise ValueError(f"max_interval ({max_interval}) must not be smaller than interval ({interval})")
+            
+        logger.info("Starting polling for group %s with interval %ss", group_id, interval)
         
         current_after_id = after_id
         iterations = 0
-        seen_message_ids = set()  # Track all message IDs we've already processed
+        current_interval = interval
         
-        while max_iterations is None or iterations < max_iterations:
-            try:
-                # Get new messages since last check
-                logger.info(f"Poll iteration {iterations + 1}: Checking for messages after ID {current_after_id}")
-                new_messages = await self.get_messages(
-                    group_id=group_id,
-                    after_id=current_after_id
-                )
+        # Optional wake-up on Telegram updates
+        wakeup = None
+        client = None
+        registered_handler = None
+        if use_events:
+            from telethon import events
+            
+            client = await self.connection_engine.get_client()
+            wakeup = asyncio.Event()
+            
+            async def wake_handler(event):
+                wakeup.set()
                 
-                if not new_messages.empty:
-                    # Get all message IDs and filter out already seen ones
-                    all_message_ids = new_messages['MessageId'].tolist()
-                    new_message_ids = [msg_id for msg_id in all_message_ids if msg_id not in seen_message_ids]
+            client.add_event_handler(wake_handler, events.NewMessage(chats=group_id))
+            registered_handler = wake_handler
+        
+        try:
+            while max_iterations is None or iterations < max_iterations:
+                try:
+                    current_after_id, found_new = await self._poll_once(
+                        group_id, current_after_id, callback, iterations + 1
+                    )
                     
-                    if new_message_ids:
-                        # Filter DataFrame to only include truly new messages
-                        truly_new_messages = new_messages[new_messages['MessageId'].isin(new_message_ids)]
-                        
-                        # Add new IDs to seen set
-                        seen_message_ids.update(new_message_ids)
-                        
-                        # Simply update to the maximum ID we've seen
-                        max_id = max(all_message_ids)
-                        logger.info(f"Poll iteration {iterations + 1}: Found {len(truly_new_messages)} new messages, IDs: {sorted(new_message_ids)}")
-                        logger.info(f"Updating after_id from {current_after_id} to {max_id}")
-                        current_after_id = max_id
+                    if found_new:
+                        # Activity seen, go back to the fastest interval
+                        current_interval = interval
+                    elif max_interval:
+                        # Back off while the group is idle
+                        current_interval = min(max_interval, current_interval * 1.5)
+                    
+                    iterations += 1
+                    
+                    # Wait for next interval (unless this is the last iteration)
+                    if max_iterations is None or iterations < max_iterations:
+                        await self._wait_for_next_poll(wakeup, current_interval)
                         
-                        # Call the callback only with truly new messages
-                        if callback:
-                            await callback(truly_new_messages)
-                    else:
-                        # All messages were duplicates, but still update after_id to the max
-                        max_id = max(all_message_ids)
-                        logger.info(f"Poll iteration {iterations + 1}: Found {len(new_messages)} messages but all were duplicates")
-                        logger.info(f"Updating after_id from {current_after_id} to {max_id}")
-                        current_after_id = max_id
-                else:
-                    logger.debug(f"Poll iteration {iterations + 1}: No new messages")
+                except Exception as e:
+                    logger.error("Error during polling: %s", e)
+                    iterations += 1  # Increment even on error to respect max_iterations
+                    
+                    # Continue polling after error (unless we've reached max iterations)
+                    if max_iterations is None or iterations < max_iterations:
+                        await self._wait_for_next_poll(wakeup, current_interval)
+        finally:
+            if registered_handler is not None:
+                client.remove_event_handler(registered_handler)
                 
-                iterations += 1
+    @staticmethod
+    async def _wait_for_next_poll(wakeup: Optional[asyncio.Event], timeout: float) -> None:
+        """
+        Sleep until the next poll is due.
+        
+        Returns early when wakeup is set by a new-message update; the event is
+        cleared before returning so the next wait starts fresh.
+        """
+        if wakeup is None:
+            await asyncio.sleep(timeout)
+            return
+            
+        try:
+            await asyncio.wait_for(wakeup.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        wakeup.clear()
+    
+    async def poll_groups(self,
+                          group_ids: List[Union[int, str]],
+                          interval: int = 60,
+                          after_ids: Optional[Dict[Union[int, str], int]] = None,
+                          callback: Optional[Callable] = None,
+                          max_iterations: Optional[int] = None) -> None:
+        """
+        Poll several groups for new messages from a single loop.
+        
+        Each tick checks every group once, one after another, then sleeps.
+        This keeps one polling coroutine instead of one poll_for_messages
+        task per group.
+        
+        Args:
+            group_ids: Group IDs or usernames to poll
+            interval: Polling interval in seconds (default: 60)
+            after_ids: Optional mapping of group ID to the message ID to start after
+            callback: Optional async callback function(group_id, messages_df)
+            max_iterations: Maximum number of polling iterations (None = infinite)
+            
+        Example:
+            async def process_messages(group_id, messages_df):
+                print(f"Got {len(messages_df)} new messages from {group_id}")
                 
-                # Wait for next interval (unless this is the last iteration)
-                if max_iterations is None or iterations < max_iterations:
-                    await asyncio.sleep(interval)
+            await tg.poll_groups(
+                group_ids=[12345, '@channelname'],
+                interval=30,
+                callback=process_messages
+            )
+        """
+        logger.info("Starting polling for %d groups with interval %ss", len(group_ids), interval)
+        
+        after_ids = after_ids or {}
+        current_after_ids = {gid: after_ids.get(gid, 0) for gid in group_ids}
+        iterations = 0
+        
+        while max_iterations is None or iterations < max_iterations:
+            for gid in group_ids:
+                group_callback = functools.partial(callback, gid) if callback else None
+                try:
+                    current_after_ids[gid], _ = await self._poll_once(
+                        gid, current_after_ids[gid], group_callback, iterations + 1
+                    )
+                except Exception as e:
+                    logger.error("Error during polling of group %s: %s", gid, e)
                     
-            except Exception as e:
-                logger.error(f"Error during polling: {e}")
-                iterations += 1  # Increment even on error to respect max_iterations
-                
-                # Continue polling after error (unless we've reached max iterations)
-                if max_iterations is None or iterations < max_iterations:
-                    await asyncio.sleep(interval)
+            iterations += 1
+            
+            # Wait for next interval (unless this is the last iteration)
+            if max_iterations is None or iterations < max_iterations:
+                await asyncio.sleep(interval)
     
     async def run_with_event_loop(self):
         """
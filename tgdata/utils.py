@@ -11,6 +11,9 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Characters that make a keyword a regular expression rather than plain text
+_REGEX_METACHARACTERS = frozenset('.^$*+?{}[]\\|()')
+
 
 def format_message_for_display(message: Dict[str, Any], max_length: int = 100) -> str:
     """
@@ -80,12 +83,11 @@ def export_to_csv(df: pd.DataFrame, filepath: str) -> None:
         filepath: Output file path
     """
     try:
-        # Remove binary data columns for CSV export
-        export_df = df.copy()
-        if 'PhotoData' in export_df.columns:
-            export_df = export_df.drop('PhotoData', axis=1)
-            
-        export_df.to_csv(filepath, index=False, encoding='utf-8')
+        # Leave out binary data columns for CSV export (selected via
+        # columns= so the DataFrame is not copied first)
+        columns = [col for col in df.columns if col != 'PhotoData']
+        
+        df.to_csv(filepath, columns=columns, index=False, encoding='utf-8')
         logger.info(f"Exported {len(df)} messages to {filepath}")
         
     except Exception as e:
@@ -127,10 +129,14 @@ def filter_messages_by_content(df: pd.DataFrame, keyword: str,
     Returns:
         Filtered DataFrame
     """
+    # Plain-text keywords skip the regex engine; the result is the same
+    is_regex = not _REGEX_METACHARACTERS.isdisjoint(keyword)
+    
     return df[df['Message'].str.contains(
         keyword, 
         case=case_sensitive, 
-        na=False
+        na=False,
+        regex=is_regex
     )]
 
 
@@ -196,17 +202,18 @@ def save_profile_photos(df: pd.DataFrame, output_dir: str) -> None:
     os.makedirs(output_dir, exist_ok=True)
     saved_count = 0
     
-    for _, row in df.iterrows():
-        if row['PhotoData'] is not None:
-            filename = f"{row['SenderId']}_{row['Username'].replace('@', '')}.jpg"
+    rows = df[['SenderId', 'Username', 'PhotoData']].itertuples(index=False, name=None)
+    for sender_id, username, photo_data in rows:
+        if photo_data is not None:
+            filename = f"{sender_id}_{username.replace('@', '')}.jpg"
             filepath = os.path.join(output_dir, filename)
             
             try:
                 with open(filepath, 'wb') as f:
-                    f.write(row['PhotoData'])
+                    f.write(photo_data)
                 saved_count += 1
             except Exception as e:
-                logger.error(f"Error saving photo for {row['SenderId']}: {e}")
+                logger.error(f"Error saving photo for {sender_id}: {e}")
                 
     logger.info(f"Saved {saved_count} profile photos to {output_dir}")
 